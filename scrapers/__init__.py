@@ -1,4 +1,5 @@
 from .bank_of_canada import fetch_boc_cpi
+from .common import load_env_file
 from .communication import scrape_communication
 from .communication_public import scrape_communication_public
 from .consensus_free import fetch_consensus_estimate
@@ -18,6 +19,8 @@ from .recreation_education import scrape_recreation_education
 from .transport import scrape_transport
 from .types import Quote, SourceHealth
 
+load_env_file()
+
 __all__ = [
     "Quote",
     "SourceHealth",
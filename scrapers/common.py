@@ -1,22 +1,47 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import ssl
 import time
 import urllib.request
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator
 from urllib.parse import urlparse
 
 DEFAULT_TIMEOUT_SECONDS = 20
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+CACHE_DIR = Path.home() / ".cache" / "truenorth"
+_FLOAT_RE = re.compile(r"(?<!\d)(\d{1,4}(?:\.\d{1,4})?)(?!\d)")
 
 
 class FetchError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
+def load_env_file(path: str = ".env") -> None:
+    """Populate ``os.environ`` from a local ``.env`` file once per process.
+
+    Non-empty variables already set in the real environment take precedence.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            lines = handle.readlines()
+    except OSError:
+        return
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = (part.strip() for part in line.split("=", 1))
+        if not os.environ.get(key):
+            os.environ[key] = value.strip('"').strip("'")
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
@@ -66,12 +91,14 @@ def fetch_json(url: str, timeout: int = DEFAULT_TIMEOUT_SECONDS, retries: int =
         raise FetchError(f"Invalid JSON from {url}: {exc}") from exc
 
 
-def parse_floats_from_text(text: str) -> list[float]:
-    candidates = re.findall(r"(?<!\d)(\d{1,4}(?:\.\d{1,4})?)(?!\d)", text)
-    values: list[float] = []
-    for value in candidates:
+def parse_floats_from_text_iter(text: str) -> Iterator[float]:
+    """Yield numeric tokens lazily so callers can stop scanning early."""
+    for match in _FLOAT_RE.finditer(text):
         try:
-            values.append(float(value))
+            yield float(match.group(1))
         except ValueError:
             continue
-    return values
+
+
+def parse_floats_from_text(text: str) -> list[float]:
+    return list(parse_floats_from_text_iter(text))
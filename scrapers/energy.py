@@ -2,24 +2,25 @@
 
 Combines:
 1. OEB (Ontario Energy Board) rate scraping (existing, fragile)
-2. StatCan monthly CPI energy aggregate fallback (reliable)
+2. StatCan monthly CPI energy aggregate fallback (reliable), read from the
+   WDS vector endpoint with the full table ZIP as a last resort
 """
 from __future__ import annotations
 
-import csv
-import io
-import urllib.request
-import zipfile
 from datetime import datetime, timezone
+from itertools import islice
 
-from .common import fetch_url, parse_floats_from_text, utc_now_iso, USER_AGENT
-from .types import Quote, SourceHealth
+from .common import fetch_url, parse_floats_from_text_iter
+from .statcan_cache import latest_canada_values
+from .statcan_wds import latest_vector
+from .types import Quote, SourceHealth, health_missing, health_ok
 
 OEB_RATES_URL = (
     "https://www.oeb.ca/consumer-information-and-protection/electricity-rates"
 )
 
-STATCAN_CPI_URL = "https://www150.statcan.gc.ca/n1/tbl/csv/18100004-eng.zip"
+# Table 18-10-0004-01, GEO=Canada, Products and product groups=Energy.
+STATCAN_ENERGY_VECTOR_ID = 41691239
 
 
 def _scrape_oeb() -> tuple[list[Quote], list[SourceHealth]]:
@@ -28,8 +29,7 @@ def _scrape_oeb() -> tuple[list[Quote], list[SourceHealth]]:
     health: list[SourceHealth] = []
     try:
         html = fetch_url(OEB_RATES_URL)
-        values = [v for v in parse_floats_from_text(html) if 1 <= v <= 50]
-        values = values[:12]
+        values = list(islice((v for v in parse_floats_from_text_iter(html) if 1 <= v <= 50), 12))
         observed = datetime.now(timezone.utc).date()
         for i, value in enumerate(values):
             quotes.append(
@@ -41,69 +41,34 @@ def _scrape_oeb() -> tuple[list[Quote], list[SourceHealth]]:
                     source="oeb_scrape",
                 )
             )
-        health.append(
-            SourceHealth(
-                source="oeb_scrape",
-                category="energy",
-                tier=2,
-                status="fresh" if quotes else "missing",
-                last_success_timestamp=utc_now_iso() if quotes else None,
-                detail=f"Collected {len(quotes)} OEB rate observations.",
-                last_observation_period=None,
-            )
-        )
+        make_health = health_ok if quotes else health_missing
+        health.append(make_health("oeb_scrape", "energy", 2, f"Collected {len(quotes)} OEB rate observations."))
     except Exception as err:
-        health.append(
-            SourceHealth(
-                source="oeb_scrape",
-                category="energy",
-                tier=2,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"OEB fetch failed: {err}",
-                last_observation_period=None,
-            )
-        )
+        health.append(health_missing("oeb_scrape", "energy", 2, f"OEB fetch failed: {err}"))
     return quotes, health
 
 
+def _latest_energy_from_zip() -> tuple[str | None, float | None]:
+    """Find the latest Canada energy index in the full CPI table ZIP."""
+    latest = latest_canada_values(lambda product: product.lower() == "energy")
+    return max(latest.values(), default=(None, None))
+
+
 def _scrape_statcan_energy() -> tuple[list[Quote], list[SourceHealth]]:
-    """Monthly StatCan CPI energy aggregate fallback."""
+    """Monthly StatCan CPI energy aggregate fallback.
+
+    Reads the single energy vector from WDS first and only downloads the full
+    table ZIP when the WDS request fails.
+    """
     quotes: list[Quote] = []
     health: list[SourceHealth] = []
     try:
-        req = urllib.request.Request(
-            STATCAN_CPI_URL,
-            headers={"User-Agent": USER_AGENT},
-        )
-        with urllib.request.urlopen(req, timeout=45) as response:
-            data = response.read()
-
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
-            csv_name = next(name for name in zf.namelist() if name.endswith(".csv"))
-            with zf.open(csv_name) as handle:
-                decoded = io.TextIOWrapper(handle, encoding="utf-8-sig", errors="ignore")
-                rows = list(csv.DictReader(decoded))
-
-        latest_ref = None
-        latest_val = None
-        for row in rows:
-            if row.get("GEO") != "Canada":
-                continue
-            product = (row.get("Products and product groups") or "").strip().lower()
-            if product != "energy":
-                continue
-            value_raw = row.get("VALUE")
-            ref_date = row.get("REF_DATE")
-            if not value_raw or not ref_date:
-                continue
-            try:
-                value = float(value_raw)
-            except ValueError:
-                continue
-            if latest_ref is None or ref_date > latest_ref:
-                latest_ref = ref_date
-                latest_val = value
+        try:
+            latest_ref, latest_val = latest_vector(STATCAN_ENERGY_VECTOR_ID)
+            origin = "WDS vector"
+        except Exception:
+            latest_ref, latest_val = _latest_energy_from_zip()
+            origin = "CSV ZIP"
 
         if latest_val is not None:
             quotes.append(
@@ -116,29 +81,15 @@ def _scrape_statcan_energy() -> tuple[list[Quote], list[SourceHealth]]:
                 )
             )
 
-        health.append(
-            SourceHealth(
-                source="statcan_energy_cpi_csv",
-                category="energy",
-                tier=1,
-                status="stale" if quotes else "missing",
-                last_success_timestamp=utc_now_iso() if quotes else None,
-                detail=f"Collected {len(quotes)} StatCan energy CPI fallback points.",
-                last_observation_period=latest_ref,
+        detail = f"Collected {len(quotes)} StatCan energy CPI fallback points via {origin}."
+        if quotes:
+            health.append(
+                health_ok("statcan_energy_cpi_csv", "energy", 1, detail, status="stale", last_observation_period=latest_ref)
             )
-        )
+        else:
+            health.append(health_missing("statcan_energy_cpi_csv", "energy", 1, detail))
     except Exception as err:
-        health.append(
-            SourceHealth(
-                source="statcan_energy_cpi_csv",
-                category="energy",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"StatCan energy fallback failed: {err}",
-                last_observation_period=None,
-            )
-        )
+        health.append(health_missing("statcan_energy_cpi_csv", "energy", 1, f"StatCan energy fallback failed: {err}"))
     return quotes, health
 
 
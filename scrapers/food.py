@@ -1,21 +1,47 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-from .common import fetch_json, utc_now_iso
-from .types import Quote, SourceHealth
+from .common import fetch_json
+from .types import Quote, SourceHealth, health_missing, health_ok
 
 OPEN_FOOD_FACTS_URL = "https://prices.openfoodfacts.org/api/v1/prices?size=250&location_country=CA"
+OPEN_FOOD_FACTS_PAGES = 4
+
+
+def _fetch_page(page: int) -> list[dict]:
+    data = fetch_json(f"{OPEN_FOOD_FACTS_URL}&page={page}")
+    return data.get("items", []) if isinstance(data, dict) else []
+
+
+def _fetch_items() -> tuple[list[dict], int]:
+    """Fetch all result pages concurrently; total time is roughly one page RTT.
+
+    Returns the items and the number of pages that failed. Failed pages are
+    dropped as long as at least one page succeeds.
+    """
+    with ThreadPoolExecutor(max_workers=OPEN_FOOD_FACTS_PAGES) as executor:
+        futures = [executor.submit(_fetch_page, page) for page in range(1, OPEN_FOOD_FACTS_PAGES + 1)]
+
+    items: list[dict] = []
+    errors: list[Exception] = []
+    for future in futures:
+        try:
+            items.extend(future.result())
+        except Exception as err:
+            errors.append(err)
+    if len(errors) == len(futures):
+        raise errors[0]
+    return items, len(errors)
 
 
 def scrape_food() -> tuple[list[Quote], list[SourceHealth]]:
     quotes: list[Quote] = []
     health: list[SourceHealth] = []
-    now = utc_now_iso()
 
     try:
-        data = fetch_json(OPEN_FOOD_FACTS_URL)
-        items = data.get("items", []) if isinstance(data, dict) else []
+        items, failed_pages = _fetch_items()
         for item in items:
             price = item.get("price")
             product = item.get("product_name") or "unknown_product"
@@ -44,27 +70,12 @@ def scrape_food() -> tuple[list[Quote], list[SourceHealth]]:
                 )
             )
 
-        status = "fresh" if quotes else "missing"
-        health.append(
-            SourceHealth(
-                source="openfoodfacts_api",
-                category="food",
-                tier=1,
-                status=status,
-                last_success_timestamp=now if quotes else None,
-                detail=f"Collected {len(quotes)} records from OpenFoodFacts API.",
-            )
-        )
-    except Exception as err:  # pragma: no cover - network dependent
-        health.append(
-            SourceHealth(
-                source="openfoodfacts_api",
-                category="food",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"Fetch failed: {err}",
-            )
-        )
+        detail = f"Collected {len(quotes)} records from OpenFoodFacts API."
+        if failed_pages:
+            detail += f" {failed_pages} of {OPEN_FOOD_FACTS_PAGES} pages failed."
+        make_health = health_ok if quotes else health_missing
+        health.append(make_health("openfoodfacts_api", "food", 1, detail))
+    except Exception as err:
+        health.append(health_missing("openfoodfacts_api", "food", 1, f"Fetch failed: {err}"))
 
     return quotes, health
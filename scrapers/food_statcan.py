@@ -7,12 +7,11 @@ from __future__ import annotations
 
 import csv
 import io
-import urllib.request
 import zipfile
 from datetime import datetime, timezone
 
-from .common import utc_now_iso, USER_AGENT
-from .types import Quote, SourceHealth
+from .http import get_bytes
+from .types import Quote, SourceHealth, health_missing, health_ok
 
 STATCAN_FOOD_URL = "https://www150.statcan.gc.ca/n1/tbl/csv/18100245-eng.zip"
 
@@ -49,12 +48,7 @@ def scrape_food_statcan() -> tuple[list[Quote], list[SourceHealth]]:
     health: list[SourceHealth] = []
 
     try:
-        req = urllib.request.Request(
-            STATCAN_FOOD_URL,
-            headers={"User-Agent": USER_AGENT},
-        )
-        with urllib.request.urlopen(req, timeout=120) as response:
-            data = response.read()
+        data = get_bytes(STATCAN_FOOD_URL, timeout=120)
 
         with zipfile.ZipFile(io.BytesIO(data)) as zf:
             csv_name = next(
@@ -102,28 +96,14 @@ def scrape_food_statcan() -> tuple[list[Quote], list[SourceHealth]]:
                 )
             )
 
-        health.append(
-            SourceHealth(
-                source="statcan_food_prices",
-                category="food",
-                tier=1,
-                status="stale" if quotes else "missing",
-                last_success_timestamp=utc_now_iso() if quotes else None,
-                detail=f"Collected {len(quotes)} retail food price observations from StatCan.",
-                last_observation_period=latest_period,
+        detail = f"Collected {len(quotes)} retail food price observations from StatCan."
+        if quotes:
+            health.append(
+                health_ok("statcan_food_prices", "food", 1, detail, status="stale", last_observation_period=latest_period)
             )
-        )
+        else:
+            health.append(health_missing("statcan_food_prices", "food", 1, detail))
     except Exception as err:
-        health.append(
-            SourceHealth(
-                source="statcan_food_prices",
-                category="food",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"Fetch failed: {err}",
-                last_observation_period=None,
-            )
-        )
+        health.append(health_missing("statcan_food_prices", "food", 1, f"Fetch failed: {err}"))
 
     return quotes, health
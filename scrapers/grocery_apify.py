@@ -1,21 +1,24 @@
 """Grocery scraper using Apify actors with redundancy and schema checks."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
 import re
 import sys
+import time
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from typing import Any
 
 try:
-    from apify_client import ApifyClient
+    from apify_client import ApifyClientAsync
 except ImportError:
-    ApifyClient = None
+    ApifyClientAsync = None
 
-from .common import utc_now_iso
-from .types import Quote, SourceHealth
+from .common import CACHE_DIR
+from .types import Quote, SourceHealth, health_missing, health_ok
 
 DEFAULT_ACTOR_IDS = [
     "sunny_eternity/loblaws-grocery-scraper",
@@ -23,30 +26,29 @@ DEFAULT_ACTOR_IDS = [
 ]
 DEFAULT_CATEGORY_URL = "https://www.realcanadiansuperstore.ca/food/dairy-eggs/c/28003"
 DEFAULT_BANNER = "superstore"
+HEDGE_DELAY_SECONDS = 20.0
+HEDGE_MIN_INTERVAL_SECONDS = 60.0
+# Let the start call itself wait briefly so short runs need no separate poll.
+START_WAIT_SECONDS = 10
+_FINISHED_RUN_STATUSES = frozenset({"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"})
+# Skip an actor after this many consecutive failures until the cooldown passes.
+BREAKER_PATH = CACHE_DIR / "apify_breaker.json"
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 300.0
 
+_PRICE_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_WS_RE = re.compile(r"\s+")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
-def _load_env_value(key: str) -> str | None:
-    value = os.getenv(key)
-    if value:
-        return value
-    if os.path.exists(".env"):
-        try:
-            with open(".env", "r", encoding="utf-8") as handle:
-                for line in handle:
-                    line = line.strip()
-                    if line.startswith(f"{key}="):
-                        return line.split("=", 1)[1].strip().strip('"').strip("'")
-        except Exception:
-            return None
-    return None
+_last_hedge_at: float | None = None
 
 
 def _load_token() -> str | None:
-    return _load_env_value("APIFY_TOKEN")
+    return os.getenv("APIFY_TOKEN")
 
 
 def _env_flag(name: str, default: bool = True) -> bool:
-    value = (_load_env_value(name) or "").strip().lower()
+    value = (os.getenv(name) or "").strip().lower()
     if not value:
         return default
     return value in {"1", "true", "yes", "on"}
@@ -69,13 +71,45 @@ def _load_previous_apify_timestamp() -> str | None:
 
 
 def _actor_ids() -> list[str]:
-    raw = (_load_env_value("APIFY_ACTOR_IDS") or "").strip()
+    raw = (os.getenv("APIFY_ACTOR_IDS") or "").strip()
     if not raw:
         return DEFAULT_ACTOR_IDS
     values = [x.strip() for x in raw.split(",")]
     return [x for x in values if x]
 
 
+def _load_breaker() -> dict[str, dict[str, float]]:
+    try:
+        payload = json.loads(BREAKER_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _save_breaker(state: dict[str, dict[str, float]]) -> None:
+    try:
+        BREAKER_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BREAKER_PATH.write_text(json.dumps(state, sort_keys=True))
+    except OSError:  # pragma: no cover - breaker state is best-effort
+        pass
+
+
+def _breaker_allow(state: dict[str, dict[str, float]], actor_id: str, now: float) -> bool:
+    entry = state.get(actor_id)
+    if not isinstance(entry, dict) or entry.get("failures", 0) < BREAKER_FAILURE_THRESHOLD:
+        return True
+    return now - entry.get("opened_at", 0.0) >= BREAKER_COOLDOWN_SECONDS
+
+
+def _breaker_record(state: dict[str, dict[str, float]], actor_id: str, ok: bool, now: float) -> None:
+    if ok:
+        state.pop(actor_id, None)
+        return
+    entry = state.get(actor_id)
+    failures = entry.get("failures", 0) if isinstance(entry, dict) else 0
+    state[actor_id] = {"failures": failures + 1, "opened_at": now}
+
+
 def _category_url_candidates(category_url: str) -> list[str]:
     values: list[str] = []
     normalized = category_url.strip()
@@ -106,7 +140,7 @@ def _parse_price(item: dict[str, Any]) -> float | None:
             except (TypeError, ValueError):
                 continue
     elif isinstance(price, str):
-        match = re.search(r"(\d+(?:\.\d+)?)", price)
+        match = _PRICE_RE.search(price)
         if match:
             try:
                 return float(match.group(1))
@@ -159,7 +193,7 @@ def _parse_unit(item: dict[str, Any]) -> str:
     for key in ("package_size", "packageSize", "size", "unitText", "unit"):
         value = item.get(key)
         if isinstance(value, str) and value.strip():
-            cleaned = re.sub(r"\s+", " ", value.strip())
+            cleaned = _WS_RE.sub(" ", value.strip())
             return cleaned.lower()
     normalized = item.get("normalized_package_size")
     if isinstance(normalized, dict):
@@ -177,9 +211,9 @@ def normalize_apify_item(item: dict[str, Any], observed: date, source_run_id: st
         return None
 
     unit = _parse_unit(item)
-    base = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    base = _SLUG_RE.sub("-", name.lower()).strip("-")
     canonical = f"{base}|{unit}"
-    suffix = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:10]
+    suffix = hashlib.blake2b(canonical.encode("utf-8"), digest_size=5).hexdigest()
     item_id = f"{base[:50]}-{suffix}"
 
     return Quote(
@@ -192,158 +226,224 @@ def normalize_apify_item(item: dict[str, Any], observed: date, source_run_id: st
     )
 
 
+@dataclass
+class _ActorOutcome:
+    actor_id: str
+    quotes: list[Quote] = field(default_factory=list)
+    source_run_id: str | None = None
+    category_url: str | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+async def _abort_run(client: Any, start: asyncio.Future[dict[str, Any]]) -> None:
+    try:
+        run = await start
+        if run.get("status") not in _FINISHED_RUN_STATUSES:
+            await client.run(run.get("id")).abort()
+    except BaseException:  # pragma: no cover - network/runtime dependent
+        pass
+
+
+async def _run_actor(
+    client: Any,
+    actor_id: str,
+    run_inputs: list[dict[str, Any]],
+    max_items: int,
+    observed: date,
+) -> _ActorOutcome:
+    """Try each category URL on one actor until a run yields valid quotes."""
+    outcome = _ActorOutcome(actor_id=actor_id)
+    for run_input in run_inputs:
+        category_url_try = run_input["categoryUrl"]
+        try:
+            start = asyncio.ensure_future(
+                client.actor(actor_id).start(run_input=run_input, wait_for_finish=START_WAIT_SECONDS)
+            )
+            try:
+                run = await asyncio.shield(start)
+                if run.get("status") not in _FINISHED_RUN_STATUSES:
+                    run = await client.run(run.get("id")).wait_for_finish() or run
+            except asyncio.CancelledError:
+                # Another actor already won; stop paying for this run.
+                await _abort_run(client, start)
+                raise
+            outcome.source_run_id = str(run.get("id") or run.get("defaultDatasetId") or "")
+            dataset_id = run.get("defaultDatasetId")
+            if not dataset_id:
+                outcome.errors.append(f"{actor_id}: missing defaultDatasetId")
+                continue
+            dataset_items = (await client.dataset(dataset_id).list_items(limit=max_items, clean=True)).items
+
+            for item in dataset_items:
+                if not isinstance(item, dict):
+                    continue
+                quote = normalize_apify_item(item, observed=observed, source_run_id=outcome.source_run_id or "")
+                if quote is not None:
+                    outcome.quotes.append(quote)
+
+            if outcome.quotes:
+                outcome.category_url = category_url_try
+                return outcome
+            location = run_input.get("locationId") or "default"
+            outcome.errors.append(f"{actor_id}: no valid records for category={category_url_try} location={location}")
+        except asyncio.CancelledError:
+            raise
+        except BaseException as err:  # pragma: no cover - network/runtime dependent
+            outcome.errors.append(f"{actor_id}: {err}")
+    return outcome
+
+
+def _take_hedge_token() -> bool:
+    """Allow at most one speculative actor launch per HEDGE_MIN_INTERVAL_SECONDS."""
+    global _last_hedge_at
+    now = time.monotonic()
+    if _last_hedge_at is not None and now - _last_hedge_at < HEDGE_MIN_INTERVAL_SECONDS:
+        return False
+    _last_hedge_at = now
+    return True
+
+
+async def _race_actors(
+    client: Any,
+    actor_ids: list[str],
+    run_inputs: list[dict[str, Any]],
+    max_items: int,
+    observed: date,
+    breaker: dict[str, dict[str, float]] | None = None,
+) -> tuple[_ActorOutcome | None, list[str], str | None]:
+    """Run actors as hedged requests and keep the first one that returns quotes.
+
+    The primary actor starts alone. If it has not finished after
+    HEDGE_DELAY_SECONDS the next actor is launched speculatively (subject to
+    the hedge budget), and whichever finishes first with quotes wins. When
+    every running actor has finished empty the next one starts immediately.
+
+    With a ``breaker`` state, actors whose circuit is open are skipped (unless
+    every actor is open) and each finished actor's result is recorded.
+    """
+    errors: list[str] = []
+    source_run_id: str | None = None
+    waiting = list(actor_ids)
+    if breaker is not None:
+        now = time.time()
+        allowed = [actor_id for actor_id in waiting if _breaker_allow(breaker, actor_id, now)]
+        if allowed:
+            errors.extend(f"{actor_id}: circuit open" for actor_id in waiting if actor_id not in allowed)
+            waiting = allowed
+    pending: set[asyncio.Task[_ActorOutcome]] = set()
+
+    def launch() -> None:
+        actor_id = waiting.pop(0)
+        pending.add(asyncio.create_task(_run_actor(client, actor_id, run_inputs, max_items=max_items, observed=observed)))
+
+    if waiting:
+        launch()
+    while pending:
+        timeout = HEDGE_DELAY_SECONDS if waiting else None
+        done, still_pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        pending.difference_update(done)
+        for task in done:
+            outcome = task.result()
+            if breaker is not None:
+                _breaker_record(breaker, outcome.actor_id, bool(outcome.quotes), time.time())
+            errors.extend(outcome.errors)
+            source_run_id = outcome.source_run_id or source_run_id
+            if outcome.quotes:
+                for other in still_pending:
+                    other.cancel()
+                await asyncio.gather(*still_pending, return_exceptions=True)
+                return outcome, errors, outcome.source_run_id
+        if waiting and (not pending or (not done and _take_hedge_token())):
+            launch()
+    return None, errors, source_run_id
+
+
+def _missing(detail: str, source_run_id: str | None = None) -> list[SourceHealth]:
+    return [health_missing("apify_loblaws", "food", 1, detail, source_run_id=source_run_id)]
+
+
+def _skipped(detail: str) -> list[SourceHealth]:
+    """Health for a run that was not attempted; reuse the last success when there is one."""
+    previous_ts = _load_previous_apify_timestamp()
+    if not previous_ts:
+        return _missing(detail)
+    return [
+        SourceHealth(
+            source="apify_loblaws",
+            category="food",
+            tier=1,
+            status="stale",
+            last_success_timestamp=previous_ts,
+            detail=detail + " Reusing last successful APIFY timestamp for freshness gating.",
+            source_run_id=None,
+        )
+    ]
+
+
 def scrape_grocery_apify() -> tuple[list[Quote], list[SourceHealth]]:
     """Run Apify actor(s) with deterministic fallback."""
     if not _env_flag("APIFY_ENABLED", default=True):
-        previous_ts = _load_previous_apify_timestamp()
-        status = "stale" if previous_ts else "missing"
-        detail = "APIFY run skipped by schedule (APIFY_ENABLED=false)."
-        if previous_ts:
-            detail += " Reusing last successful APIFY timestamp for freshness gating."
-        return [], [
-            SourceHealth(
-                source="apify_loblaws",
-                category="food",
-                tier=1,
-                status=status,
-                last_success_timestamp=previous_ts,
-                detail=detail,
-                source_run_id=None,
-            )
-        ]
+        return [], _skipped("APIFY run skipped by schedule (APIFY_ENABLED=false).")
 
     token = _load_token()
 
     if not token:
-        return [], [
-            SourceHealth(
-                source="apify_loblaws",
-                category="food",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail="APIFY_TOKEN not found in environment.",
-                source_run_id=None,
-            )
-        ]
+        return [], _missing("APIFY_TOKEN not found in environment.")
 
-    if ApifyClient is None:
-        return [], [
-            SourceHealth(
-                source="apify_loblaws",
-                category="food",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail="apify-client library not installed.",
-                source_run_id=None,
-            )
-        ]
+    if ApifyClientAsync is None:
+        return [], _missing("apify-client library not installed.")
 
     if sys.version_info >= (3, 13):
-        previous_ts = _load_previous_apify_timestamp()
-        status = "stale" if previous_ts else "missing"
-        detail = "Python 3.13 is not supported for apify-client in this project. Use Python 3.11."
-        if previous_ts:
-            detail += " Reusing last successful APIFY timestamp for freshness gating."
-        return [], [
-            SourceHealth(
-                source="apify_loblaws",
-                category="food",
-                tier=1,
-                status=status,
-                last_success_timestamp=previous_ts,
-                detail=detail,
-                source_run_id=None,
-            )
-        ]
+        return [], _skipped("Python 3.13 is not supported for apify-client in this project. Use Python 3.11.")
 
-    quotes: list[Quote] = []
-    errors: list[str] = []
     observed = datetime.now(timezone.utc).date()
-    category_url = _load_env_value("APIFY_CATEGORY_URL") or DEFAULT_CATEGORY_URL
+    category_url = os.getenv("APIFY_CATEGORY_URL") or DEFAULT_CATEGORY_URL
     category_url_candidates = _category_url_candidates(category_url)
-    banner = (_load_env_value("APIFY_BANNER") or DEFAULT_BANNER).strip().lower()
-    location_id = (_load_env_value("APIFY_LOCATION_ID") or "").strip()
-    max_items_raw = _load_env_value("APIFY_MAX_ITEMS") or "50"
+    banner = (os.getenv("APIFY_BANNER") or DEFAULT_BANNER).strip().lower()
+    location_id = (os.getenv("APIFY_LOCATION_ID") or "").strip()
+    max_items_raw = os.getenv("APIFY_MAX_ITEMS") or "50"
     try:
         max_items = int(max_items_raw)
     except ValueError:
         max_items = 50
     actor_ids = _actor_ids()
-    source_run_id: str | None = None
+
+    run_inputs: list[dict[str, Any]] = []
+    for category_url_try in category_url_candidates:
+        run_input: dict[str, Any] = {
+            "banner": banner,
+            "categoryUrl": category_url_try,
+            "maxItems": max_items,
+            "proxyConfig": {"useApifyProxy": True},
+        }
+        if location_id:
+            run_input["locationId"] = location_id
+        run_inputs.append(run_input)
 
     try:
         # NOTE: apify-client currently crashes on Python 3.13 in some envs.
         # Pinning runtime to 3.11 in CI/prod avoids this failure mode.
-        client = ApifyClient(token)
+        client = ApifyClientAsync(token)
     except BaseException as err:  # pragma: no cover - runtime dependent
-        return [], [
-            SourceHealth(
-                source="apify_loblaws",
-                category="food",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"Apify client init failed: {err}",
-                source_run_id=None,
+        return [], _missing(f"Apify client init failed: {err}")
+
+    breaker = _load_breaker()
+    winner, errors, source_run_id = asyncio.run(
+        _race_actors(client, actor_ids, run_inputs, max_items=max_items, observed=observed, breaker=breaker)
+    )
+    _save_breaker(breaker)
+    if winner is not None:
+        return winner.quotes, [
+            health_ok(
+                "apify_loblaws",
+                "food",
+                1,
+                f"Collected {len(winner.quotes)} prices from actor {winner.actor_id} (banner={banner}, category={winner.category_url}, location={location_id or 'default'}).",
+                source_run_id=winner.source_run_id,
             )
         ]
 
-    for actor_id in actor_ids:
-        for category_url_try in category_url_candidates:
-            run_input = {
-                "banner": banner,
-                "categoryUrl": category_url_try,
-                "maxItems": max_items,
-                "proxyConfig": {"useApifyProxy": True},
-            }
-            if location_id:
-                run_input["locationId"] = location_id
-
-            try:
-                run = client.actor(actor_id).call(run_input=run_input)
-                source_run_id = str(run.get("id") or run.get("defaultDatasetId") or "")
-                dataset_id = run.get("defaultDatasetId")
-                if not dataset_id:
-                    errors.append(f"{actor_id}: missing defaultDatasetId")
-                    continue
-                dataset_items = client.dataset(dataset_id).list_items(limit=max_items).items
-
-                for item in dataset_items:
-                    if not isinstance(item, dict):
-                        continue
-                    quote = normalize_apify_item(item, observed=observed, source_run_id=source_run_id or "")
-                    if quote is not None:
-                        quotes.append(quote)
-
-                if quotes:
-                    return quotes, [
-                        SourceHealth(
-                            source="apify_loblaws",
-                            category="food",
-                            tier=1,
-                            status="fresh",
-                            last_success_timestamp=utc_now_iso(),
-                            detail=f"Collected {len(quotes)} prices from actor {actor_id} (banner={banner}, category={category_url_try}, location={location_id or 'default'}).",
-                            source_run_id=source_run_id,
-                        )
-                    ]
-                errors.append(f"{actor_id}: no valid records for category={category_url_try} location={location_id or 'default'}")
-            except BaseException as err:  # pragma: no cover - network/runtime dependent
-                errors.append(f"{actor_id}: {err}")
-
     detail = "Apify run failed for all actors."
     if errors:
         detail = detail + " " + " | ".join(errors[:3])
-    return [], [
-        SourceHealth(
-            source="apify_loblaws",
-            category="food",
-            tier=1,
-            status="missing",
-            last_success_timestamp=None,
-            detail=detail,
-            source_run_id=source_run_id,
-        )
-    ]
+    return [], _missing(detail, source_run_id=source_run_id)
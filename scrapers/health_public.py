@@ -1,9 +1,11 @@
 """Supplemental health/personal proxies from public references."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
 
-from .common import fetch_url, parse_floats_from_text, utc_now_iso
+from .common import fetch_url, parse_floats_from_text_iter, utc_now_iso
 from .types import Quote, SourceHealth
 
 HEALTH_DPD_URL = "https://health-products.canada.ca/dpd-bdpp/index-eng.jsp"
@@ -19,12 +21,20 @@ def _fetch_health_source(url: str) -> tuple[str, str]:
 
 
 def _fetch_pmprb_with_fallback() -> tuple[str, str]:
+    """Request every PMPRB URL at once and return the first in priority order that answers."""
     last_error: Exception | None = None
-    for url in PMPRB_REPORTS_URLS:
-        try:
-            return url, fetch_url(url, timeout=20, retries=1)
-        except Exception as err:
-            last_error = err
+    executor = ThreadPoolExecutor(max_workers=len(PMPRB_REPORTS_URLS))
+    try:
+        futures = [executor.submit(fetch_url, url, timeout=20, retries=1) for url in PMPRB_REPORTS_URLS]
+        # The URLs are different pages, so a later one is only used when every
+        # earlier one failed; this keeps pmprb_reports_* stable across runs.
+        for url, future in zip(PMPRB_REPORTS_URLS, futures):
+            try:
+                return url, future.result()
+            except Exception as err:
+                last_error = err
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     raise RuntimeError(f"All PMPRB URLs failed: {last_error}")
 
 
@@ -33,12 +43,16 @@ def scrape_health_public() -> tuple[list[Quote], list[SourceHealth]]:
     health: list[SourceHealth] = []
     observed = datetime.now(timezone.utc).date()
 
-    for source in ("healthcanada_dpd", "pmprb_reports"):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = {
+            "healthcanada_dpd": executor.submit(_fetch_health_source, HEALTH_DPD_URL),
+            "pmprb_reports": executor.submit(_fetch_pmprb_with_fallback),
+        }
+
+    for source, future in pending.items():
         try:
-            fetched_url, html = (
-                _fetch_pmprb_with_fallback() if source == "pmprb_reports" else _fetch_health_source(HEALTH_DPD_URL)
-            )
-            values = [v for v in parse_floats_from_text(html) if 1 <= v <= 500][:8]
+            fetched_url, html = future.result()
+            values = list(islice((v for v in parse_floats_from_text_iter(html) if 1 <= v <= 500), 8))
             for idx, value in enumerate(values):
                 quotes.append(
                     Quote(
@@ -1,22 +1,15 @@
 """Housing category scraper — StatCan CPI table 18-10-0004 CSV download.
 
-Downloads the full CPI table as a ZIP/CSV from Statistics Canada and
+Reads the full CPI table (shared ZIP/CSV download, see ``statcan_cache``) and
 extracts the latest Shelter and Rent index values for Canada.
 Falls back gracefully if the download fails.
 """
 from __future__ import annotations
 
-import csv
-import io
-import urllib.request
-import zipfile
 from datetime import datetime, timezone
 
-from .common import utc_now_iso, USER_AGENT
-from .types import Quote, SourceHealth
-
-# StatCan WDS returns a download URL for this table
-STATCAN_CSV_URL = "https://www150.statcan.gc.ca/n1/tbl/csv/18100004-eng.zip"
+from .statcan_cache import latest_canada_values
+from .types import Quote, SourceHealth, health_missing, health_ok
 
 # Products we care about for the housing category
 TARGET_PRODUCTS = {"Shelter", "Rented accommodation", "Owned accommodation"}
@@ -27,43 +20,8 @@ def scrape_housing() -> tuple[list[Quote], list[SourceHealth]]:
     health: list[SourceHealth] = []
 
     try:
-        # Fetch the ZIP file directly as bytes
-        req = urllib.request.Request(
-            STATCAN_CSV_URL,
-            headers={"User-Agent": USER_AGENT},
-        )
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = response.read()
-
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
-            csv_name = next(
-                name for name in zf.namelist() if name.endswith(".csv")
-            )
-            with zf.open(csv_name) as handle:
-                decoded = io.TextIOWrapper(
-                    handle, encoding="utf-8-sig", errors="ignore"
-                )
-                rows = list(csv.DictReader(decoded))
-
         # Find the latest value for each target product in Canada
-        latest_by_product: dict[str, tuple[str, float]] = {}
-        for row in rows:
-            if row.get("GEO") != "Canada":
-                continue
-            product = (row.get("Products and product groups") or "").strip()
-            if product not in TARGET_PRODUCTS:
-                continue
-            value_raw = row.get("VALUE")
-            ref_date = row.get("REF_DATE")
-            if not value_raw or not ref_date:
-                continue
-            try:
-                value = float(value_raw)
-            except ValueError:
-                continue
-            prev = latest_by_product.get(product)
-            if prev is None or ref_date > prev[0]:
-                latest_by_product[product] = (ref_date, value)
+        latest_by_product = latest_canada_values(TARGET_PRODUCTS.__contains__)
 
         observed = datetime.now(timezone.utc).date()
         latest_period = None
@@ -79,28 +37,14 @@ def scrape_housing() -> tuple[list[Quote], list[SourceHealth]]:
                 )
             )
 
-        health.append(
-            SourceHealth(
-                source="statcan_cpi_csv",
-                category="housing",
-                tier=1,
-                status="stale" if quotes else "missing",
-                last_success_timestamp=utc_now_iso() if quotes else None,
-                detail=f"Collected {len(quotes)} CPI housing proxies from StatCan CSV.",
-                last_observation_period=latest_period,
+        detail = f"Collected {len(quotes)} CPI housing proxies from StatCan CSV."
+        if quotes:
+            health.append(
+                health_ok("statcan_cpi_csv", "housing", 1, detail, status="stale", last_observation_period=latest_period)
             )
-        )
+        else:
+            health.append(health_missing("statcan_cpi_csv", "housing", 1, detail))
     except Exception as err:
-        health.append(
-            SourceHealth(
-                source="statcan_cpi_csv",
-                category="housing",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"Fetch failed: {err}",
-                last_observation_period=None,
-            )
-        )
+        health.append(health_missing("statcan_cpi_csv", "housing", 1, f"Fetch failed: {err}"))
 
     return quotes, health
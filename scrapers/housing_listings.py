@@ -16,6 +16,18 @@ from .types import Quote, SourceHealth
 # We route via Google Web Cache to bypass the 403 Forbidden.
 RENTALS_CA_URL = "https://webcache.googleusercontent.com/search?q=cache:https://rentals.ca/national-rent-report"
 
+# Pattern:  $X,XXX
+PRICE_RE = re.compile(r"\$(\d{1,2}(?:,\d{3}))")
+
+# First $X,XXX inside a <p> that mentions both "average asking rent" and
+# "Canada" (in any order), found in one pass without splitting the page.
+# A paragraph ends at </p> or at the next <p>, since closing tags are optional.
+_IN_PARAGRAPH = r"(?:(?!</?p\b).)*?"
+HEADLINE_PARAGRAPH_RE = re.compile(
+    rf"<p\b[^>]*>(?={_IN_PARAGRAPH}average asking rent)(?={_IN_PARAGRAPH}canada){_IN_PARAGRAPH}\$(\d{{1,2}}(?:,\d{{3}}))",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 def scrape_housing_listings() -> tuple[list[Quote], list[SourceHealth]]:
     quotes: list[Quote] = []
@@ -35,12 +47,6 @@ def scrape_housing_listings() -> tuple[list[Quote], list[SourceHealth]]:
         # Look for the specific "National Overview" section or just the first occurence of the national average
         # Usually in the first few paragraphs.
         
-        # Pattern:  $X,XXX
-        price_pattern = re.compile(r"\$(\d{1,2}(?:,\d{3}))")
-        
-        # Find all prices
-        prices = price_pattern.findall(html)
-        
         # The first few prices in the text are usually the national average.
         # We need to be careful not to pick up an ad or a specific city.
         # The report usually starts with "The average asking rent for all residential property types in Canada..."
@@ -49,24 +55,19 @@ def scrape_housing_listings() -> tuple[list[Quote], list[SourceHealth]]:
         # and extract the price from *that* paragraph.
         
         candidates = []
-        for paragraph in html.split("<p>"):
-            clean_p = paragraph.split("</p>")[0]
-            if "average asking rent" in clean_p.lower() and "canada" in clean_p.lower():
-                # Extract price
-                match = price_pattern.search(clean_p)
-                if match:
-                    val_str = match.group(1).replace(",", "")
-                    try:
-                        val = float(val_str)
-                        if 1000 < val < 4000: # Sanity check for broad monthly rent range
-                            candidates.append(val)
-                    except ValueError:
-                        pass
+        for match in HEADLINE_PARAGRAPH_RE.finditer(html):
+            val_str = match.group(1).replace(",", "")
+            try:
+                val = float(val_str)
+                if 1000 < val < 4000: # Sanity check for broad monthly rent range
+                    candidates.append(val)
+            except ValueError:
+                pass
         
         if not candidates:
              # Fallback: just look for the first reasonable price in the whole body (scrappy!)
-             for p in prices:
-                 val_str = p.replace(",", "")
+             for price_match in PRICE_RE.finditer(html):
+                 val_str = price_match.group(1).replace(",", "")
                  try:
                      val = float(val_str)
                      if 1500 < val < 3500: # Tighter sanity check for national average
@@ -0,0 +1,123 @@
+"""Shared HTTP client with retry/backoff and a process-wide retry budget.
+
+One pooled ``httpx.Client`` keeps connections (and TLS sessions) alive across
+scrapers. Transient failures are retried with jittered exponential backoff,
+``Retry-After`` is honoured, and a token bucket caps how many retries the
+whole process may spend so an upstream outage is not amplified.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is listed in requirements.txt
+    httpx = None
+
+from .common import DEFAULT_TIMEOUT_SECONDS, USER_AGENT, FetchError
+
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 30.0
+
+
+class RetryBudget:
+    """Token bucket shared by every request; each retry spends one token."""
+
+    def __init__(self, capacity: float, refill_per_second: float) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+RETRY_BUDGET = RetryBudget(capacity=10, refill_per_second=0.1)
+
+
+@lru_cache(maxsize=1)
+def get_client() -> Any:
+    if httpx is None:
+        raise FetchError("httpx library not installed.")
+    return httpx.Client(
+        headers={"User-Agent": USER_AGENT},
+        timeout=DEFAULT_TIMEOUT_SECONDS,
+        follow_redirects=True,
+    )
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(attempt: int, retry_after: float | None) -> float:
+    if retry_after is not None:
+        return min(BACKOFF_CAP_SECONDS, retry_after)
+    return min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    json: Any = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    retries: int = 2,
+) -> Any:
+    """Send a request, retrying transport errors and 408/429/5xx responses.
+
+    Other responses, including 304 and non-retryable 4xx, are returned as-is.
+    """
+    client = get_client()
+    last_err: Exception | None = None
+    for attempt in range(retries + 1):
+        retry_after: float | None = None
+        try:
+            response = client.request(method, url, headers=headers, json=json, timeout=timeout)
+        except httpx.TransportError as err:  # pragma: no cover - network dependent
+            last_err = err
+        else:
+            if response.status_code not in RETRYABLE_STATUS:
+                return response
+            last_err = FetchError(f"HTTP {response.status_code}")
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+        if attempt >= retries or not RETRY_BUDGET.try_acquire():
+            break
+        time.sleep(_backoff_delay(attempt, retry_after))
+    raise FetchError(f"Failed to fetch URL: {url}: {last_err}")
+
+
+def get_bytes(url: str, timeout: float = DEFAULT_TIMEOUT_SECONDS, retries: int = 2) -> bytes:
+    response = request("GET", url, timeout=timeout, retries=retries)
+    if response.status_code >= 400:
+        raise FetchError(f"Failed to fetch URL: {url}: HTTP {response.status_code}")
+    return response.content
@@ -1,33 +1,14 @@
 from __future__ import annotations
 
-import csv
-import io
-import urllib.request
-import zipfile
 from typing import Any
 
-from .common import USER_AGENT
+from .statcan_cache import get_canada_cpi_rows
 
-STATCAN_CPI_ZIP = "https://www150.statcan.gc.ca/n1/en/tbl/csv/18100004-eng.zip"
 ALL_ITEMS = "All-items"
 
 
-def _download_zip_bytes(url: str) -> bytes:
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=30) as response:
-        return response.read()
-
-
 def _load_cpi_rows() -> list[dict[str, str]]:
-    data = _download_zip_bytes(STATCAN_CPI_ZIP)
-    if not zipfile.is_zipfile(io.BytesIO(data)):
-        return []
-
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        csv_name = next(name for name in zf.namelist() if name.endswith(".csv"))
-        with zf.open(csv_name) as handle:
-            decoded = io.TextIOWrapper(handle, encoding="utf-8-sig", errors="ignore")
-            return list(csv.DictReader(decoded))
+    return get_canada_cpi_rows()
 
 
 def _candidate_rows(rows: list[dict[str, str]]) -> list[dict[str, str]]:
@@ -0,0 +1,118 @@
+"""Shared download cache for the StatCan CPI table 18-10-0004 ZIP.
+
+Housing, official CPI and the energy fallback all read the same multi-MB
+table. The ZIP is downloaded at most once per process and revalidated
+across runs with a conditional GET against an on-disk copy.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zipfile
+from functools import lru_cache
+from typing import Callable
+
+from .common import CACHE_DIR, FetchError
+from .http import request
+
+STATCAN_CPI_ZIP = "https://www150.statcan.gc.ca/n1/en/tbl/csv/18100004-eng.zip"
+CACHE_ZIP_PATH = CACHE_DIR / "statcan_cpi.zip"
+CACHE_META_PATH = CACHE_DIR / "statcan_cpi.meta.json"
+KEPT_COLUMNS = ("REF_DATE", "GEO", "Products and product groups", "VALUE")
+
+
+def _read_meta() -> dict[str, str]:
+    try:
+        payload = json.loads(CACHE_META_PATH.read_text())
+    except Exception:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_cache(data: bytes, meta: dict[str, str]) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_ZIP_PATH.with_suffix(".zip.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(CACHE_ZIP_PATH)
+        CACHE_META_PATH.write_text(json.dumps(meta))
+    except OSError:  # pragma: no cover - cache is best-effort
+        pass
+
+
+@lru_cache(maxsize=1)
+def fetch_cpi_zip() -> bytes:
+    """Return the CPI table ZIP, reusing the on-disk copy when StatCan answers 304."""
+    headers: dict[str, str] = {}
+    if CACHE_ZIP_PATH.exists():
+        meta = _read_meta()
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = request("GET", STATCAN_CPI_ZIP, headers=headers, timeout=45)
+    if response.status_code == 304:
+        return CACHE_ZIP_PATH.read_bytes()
+    if response.status_code >= 400:
+        raise FetchError(f"Failed to fetch URL: {STATCAN_CPI_ZIP}: HTTP {response.status_code}")
+    data = response.content
+    meta = {
+        "etag": response.headers.get("ETag") or "",
+        "last_modified": response.headers.get("Last-Modified") or "",
+    }
+
+    _write_cache(data, meta)
+    return data
+
+
+@lru_cache(maxsize=1)
+def get_canada_cpi_rows() -> list[dict[str, str]]:
+    """Canada-level rows of the CPI table, shared by every caller in the process.
+
+    Rows are streamed with ``csv.reader`` and provincial rows are dropped by
+    column index before any dict is built, so only the ``REF_DATE``, ``GEO``,
+    product and ``VALUE`` columns of Canada rows are kept. The returned list
+    is cached; callers must treat it as read-only.
+    """
+    try:
+        zf = zipfile.ZipFile(io.BytesIO(fetch_cpi_zip()))
+    except zipfile.BadZipFile:
+        return []
+
+    rows: list[dict[str, str]] = []
+    with zf:
+        csv_name = next(name for name in zf.namelist() if name.endswith(".csv"))
+        with zf.open(csv_name) as handle:
+            reader = csv.reader(io.TextIOWrapper(handle, encoding="utf-8-sig", errors="ignore"))
+            header = next(reader, [])
+            indexes = [(column, header.index(column)) for column in KEPT_COLUMNS]
+            geo_idx = header.index("GEO")
+            min_width = max(idx for _, idx in indexes) + 1
+            for row in reader:
+                if len(row) < min_width or row[geo_idx] != "Canada":
+                    continue
+                rows.append({column: row[idx] for column, idx in indexes})
+    return rows
+
+
+def latest_canada_values(match: Callable[[str], bool]) -> dict[str, tuple[str, float]]:
+    """Latest ``(REF_DATE, value)`` per Canada product whose name satisfies ``match``."""
+    latest_by_product: dict[str, tuple[str, float]] = {}
+    for row in get_canada_cpi_rows():
+        product = row["Products and product groups"].strip()
+        if not match(product):
+            continue
+        value_raw = row["VALUE"]
+        ref_date = row["REF_DATE"]
+        if not value_raw or not ref_date:
+            continue
+        prev = latest_by_product.get(product)
+        if prev is not None and ref_date <= prev[0]:
+            continue
+        try:
+            latest_by_product[product] = (ref_date, float(value_raw))
+        except ValueError:
+            continue
+    return latest_by_product
@@ -0,0 +1,38 @@
+"""Statistics Canada Web Data Service (WDS) helpers.
+
+The WDS vector endpoints return a few KB of JSON for the latest N points of a
+single series, which is far cheaper than downloading a full table ZIP when we
+only need the newest value.
+"""
+from __future__ import annotations
+
+from .common import DEFAULT_TIMEOUT_SECONDS, FetchError
+from .http import request
+
+WDS_LATEST_N_URL = "https://www150.statcan.gc.ca/t1/wds/rest/getDataFromVectorsAndLatestNPeriods"
+
+
+def latest_vector(vector_id: int, n: int = 1, timeout: int = DEFAULT_TIMEOUT_SECONDS) -> tuple[str, float]:
+    """Return ``(ref_month, value)`` for the newest observation of a WDS vector.
+
+    ``ref_month`` uses the ``YYYY-MM`` shape of the table CSV ``REF_DATE`` column.
+    """
+    response = request(
+        "POST",
+        WDS_LATEST_N_URL,
+        json=[{"vectorId": vector_id, "latestN": n}],
+        timeout=timeout,
+    )
+    if response.status_code >= 400:
+        raise FetchError(f"WDS vector v{vector_id} request failed: HTTP {response.status_code}")
+    payload = response.json()
+
+    try:
+        entry = payload[0]
+        if entry.get("status") != "SUCCESS":
+            raise FetchError(f"WDS vector v{vector_id} returned status {entry.get('status')}")
+        points = entry["object"]["vectorDataPoint"]
+        latest = max(points, key=lambda point: point["refPer"])
+        return latest["refPer"][:7], float(latest["value"])
+    except (IndexError, KeyError, TypeError, ValueError) as exc:
+        raise FetchError(f"Unexpected WDS payload for vector v{vector_id}: {exc}") from exc
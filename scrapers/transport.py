@@ -8,12 +8,11 @@ from __future__ import annotations
 
 import csv
 import io
-import urllib.request
 import zipfile
 from datetime import datetime, timezone
 
-from .common import utc_now_iso, USER_AGENT
-from .types import Quote, SourceHealth
+from .http import get_bytes
+from .types import Quote, SourceHealth, health_missing, health_ok
 
 # StatCan table for monthly gasoline/fuel prices
 STATCAN_GAS_URL = "https://www150.statcan.gc.ca/n1/tbl/csv/18100001-eng.zip"
@@ -33,12 +32,7 @@ def scrape_transport() -> tuple[list[Quote], list[SourceHealth]]:
     health: list[SourceHealth] = []
 
     try:
-        req = urllib.request.Request(
-            STATCAN_GAS_URL,
-            headers={"User-Agent": USER_AGENT},
-        )
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = response.read()
+        data = get_bytes(STATCAN_GAS_URL, timeout=30)
 
         with zipfile.ZipFile(io.BytesIO(data)) as zf:
             csv_name = next(
@@ -91,28 +85,14 @@ def scrape_transport() -> tuple[list[Quote], list[SourceHealth]]:
                 )
             )
 
-        health.append(
-            SourceHealth(
-                source="statcan_gas_csv",
-                category="transport",
-                tier=1,
-                status="stale" if quotes else "missing",
-                last_success_timestamp=utc_now_iso() if quotes else None,
-                detail=f"Collected {len(quotes)} fuel price observations from StatCan.",
-                last_observation_period=latest_period,
+        detail = f"Collected {len(quotes)} fuel price observations from StatCan."
+        if quotes:
+            health.append(
+                health_ok("statcan_gas_csv", "transport", 1, detail, status="stale", last_observation_period=latest_period)
             )
-        )
+        else:
+            health.append(health_missing("statcan_gas_csv", "transport", 1, detail))
     except Exception as err:
-        health.append(
-            SourceHealth(
-                source="statcan_gas_csv",
-                category="transport",
-                tier=1,
-                status="missing",
-                last_success_timestamp=None,
-                detail=f"Fetch failed: {err}",
-                last_observation_period=None,
-            )
-        )
+        health.append(health_missing("statcan_gas_csv", "transport", 1, f"Fetch failed: {err}"))
 
     return quotes, health
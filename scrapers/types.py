@@ -3,8 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 
+from .common import utc_now_iso
 
-@dataclass
+
+@dataclass(slots=True)
 class Quote:
     category: str
     item_id: str
@@ -14,7 +16,7 @@ class Quote:
     source_run_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceHealth:
     source: str
     category: str
@@ -24,3 +26,44 @@ class SourceHealth:
     detail: str
     source_run_id: str | None = None
     last_observation_period: str | None = None
+
+
+def health_ok(
+    source: str,
+    category: str,
+    tier: int,
+    detail: str,
+    status: str = "fresh",
+    last_observation_period: str | None = None,
+    source_run_id: str | None = None,
+) -> SourceHealth:
+    """Health row for a source that produced data; ``status`` may be ``"stale"`` for lagged series."""
+    return SourceHealth(
+        source=source,
+        category=category,
+        tier=tier,
+        status=status,
+        last_success_timestamp=utc_now_iso(),
+        detail=detail,
+        source_run_id=source_run_id,
+        last_observation_period=last_observation_period,
+    )
+
+
+def health_missing(
+    source: str,
+    category: str,
+    tier: int,
+    detail: str,
+    source_run_id: str | None = None,
+) -> SourceHealth:
+    """Health row for a source that produced no usable data."""
+    return SourceHealth(
+        source=source,
+        category=category,
+        tier=tier,
+        status="missing",
+        last_success_timestamp=None,
+        detail=detail,
+        source_run_id=source_run_id,
+    )
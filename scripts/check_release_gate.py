@@ -13,18 +13,14 @@ from gate_policy import GATE_POLICY
 
 
 def _count_live_days(history: dict) -> int:
-    count = 0
-    for payload in history.values():
-        if not isinstance(payload, dict):
-            continue
-        headline = payload.get("headline", {})
-        meta = payload.get("meta", {})
-        seeded = isinstance(meta, dict) and bool(meta.get("seeded"))
-        if seeded:
-            continue
-        if isinstance(headline, dict) and headline.get("nowcast_yoy_pct") is not None:
-            count += 1
-    return count
+    return sum(
+        1
+        for payload in history.values()
+        if isinstance(payload, dict)
+        and not (isinstance(meta := payload.get("meta"), dict) and meta.get("seeded"))
+        and isinstance(headline := payload.get("headline"), dict)
+        and headline.get("nowcast_yoy_pct") is not None
+    )
 
 
 def main() -> int:
@@ -59,8 +55,8 @@ def main() -> int:
         print("Gate check failed: data/historical.json not found.")
         return 1
 
-    payload = json.loads(latest_path.read_text())
-    historical = json.loads(historical_path.read_text())
+    payload = json.loads(latest_path.read_bytes())
+    historical = json.loads(historical_path.read_bytes())
     release = payload.get("release", {})
     headline = payload.get("headline", {})
     official = payload.get("official_cpi", {})
@@ -5,6 +5,7 @@ import json
 import sys
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Iterable
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -18,44 +19,50 @@ DEFAULT_OUTPUT = Path("data/historical.json")
 
 
 def _load_history(path: Path) -> dict:
-    if not path.exists():
-        return {}
     try:
-        payload = json.loads(path.read_text())
-    except Exception:
+        payload = json.loads(path.read_bytes())
+    except (OSError, ValueError):
         return {}
     return payload if isinstance(payload, dict) else {}
 
 
-def _series_index(series: list[dict]) -> list[tuple[date, dict]]:
-    indexed: list[tuple[date, dict]] = []
-    for row in series:
-        ref = row.get("ref_date")
-        if not isinstance(ref, str):
-            continue
-        try:
-            month_key = date.fromisoformat(f"{ref}-01")
-        except ValueError:
-            continue
-        indexed.append((month_key, row))
-    indexed.sort(key=lambda item: item[0])
-    return indexed
-
-
-def _series_for_day(day: date, indexed: list[tuple[date, dict]]) -> dict | None:
-    if not indexed:
-        return None
-    month_key = date(day.year, day.month, 1)
-    chosen: dict | None = None
-    for ref_month, row in indexed:
-        if ref_month <= month_key:
-            chosen = row
-        else:
-            break
-    return chosen or indexed[0][1]
+def _is_ref_month(ref: object) -> bool:
+    return (
+        isinstance(ref, str)
+        and len(ref) == 7
+        and ref[4] == "-"
+        and ref[:4].isdigit()
+        and ref[5:].isdigit()
+        and "01" <= ref[5:] <= "12"
+    )
 
 
-def _build_seeded_row(day: date, official: dict) -> dict:
+def _series_index(series: Iterable[dict]) -> tuple[list[str], list[dict]]:
+    # "YYYY-MM" strings sort in calendar order, so no date objects are needed.
+    indexed = sorted(
+        ((row["ref_date"], row) for row in series if _is_ref_month(row.get("ref_date"))),
+        key=lambda item: item[0],
+    )
+    return [month_key for month_key, _ in indexed], [row for _, row in indexed]
+
+
+def _series_for_days(day_keys: list[str], month_keys: list[str], rows: list[dict]) -> list[dict]:
+    # Both lists are ascending, so one forward pass maps every day to the latest
+    # month at or before it (days before the first month use the earliest row).
+    if not rows:
+        return []
+    chosen: list[dict] = []
+    idx = 0
+    last = len(month_keys) - 1
+    for key in day_keys:
+        month = key[:7]
+        while idx < last and month_keys[idx + 1] <= month:
+            idx += 1
+        chosen.append(rows[idx])
+    return chosen
+
+
+def _build_month_template(official: dict) -> dict:
     return {
         "official_cpi": {
             "latest_release_month": official.get("ref_date"),
@@ -66,15 +73,18 @@ def _build_seeded_row(day: date, official: dict) -> dict:
             "seeded": True,
             "seed_type": "official_monthly_baseline",
             "seed_source": "statcan_cpi_csv",
-            "seeded_for_date": day.isoformat(),
         },
     }
 
 
-def seed_history(days: int, output: Path, force: bool) -> tuple[int, int, int]:
+def _build_seeded_row(key: str, template: dict) -> dict:
+    return {**template, "meta": {**template["meta"], "seeded_for_date": key}}
+
+
+def seed_history(days: int, output: Path, force: bool, compact: bool = False) -> tuple[int, int, int]:
     series = fetch_official_cpi_series()
-    indexed = _series_index(series)
-    if not indexed:
+    month_keys, rows = _series_index(series)
+    if not rows:
         raise RuntimeError("Could not load official CPI series.")
 
     history = _load_history(output)
@@ -84,28 +94,37 @@ def seed_history(days: int, output: Path, force: bool) -> tuple[int, int, int]:
     written = 0
     skipped_existing = 0
     missing_series = 0
+    templates: dict[str, dict] = {}
+    day_keys = [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+    officials = _series_for_days(day_keys, month_keys, rows)
 
-    for offset in range(days):
-        current_day = start + timedelta(days=offset)
-        key = current_day.isoformat()
-
+    for key, official in zip(day_keys, officials):
         existing = history.get(key)
-        existing_seeded = isinstance(existing, dict) and isinstance(existing.get("meta"), dict) and bool(existing["meta"].get("seeded"))
-        if isinstance(existing, dict) and not force and not existing_seeded:
-            skipped_existing += 1
-            continue
-
-        official = _series_for_day(current_day, indexed)
-        if official is None:
-            missing_series += 1
+        if not force and isinstance(existing, dict):
+            meta = existing.get("meta")
+            if not (isinstance(meta, dict) and meta.get("seeded")):
+                skipped_existing += 1
+                continue
+
+        template = templates.get(official["ref_date"])
+        if template is None:
+            template = templates[official["ref_date"]] = _build_month_template(official)
+        row = _build_seeded_row(key, template)
+        if row == existing:
             continue
-
-        history[key] = _build_seeded_row(current_day, official)
+        history[key] = row
         written += 1
 
-    ordered = {k: history[k] for k in sorted(history.keys())}
+    if not written:
+        return written, skipped_existing, missing_series
+
+    ordered = dict(sorted(history.items()))
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(ordered, indent=2))
+    with output.open("w", buffering=65536) as fp:
+        if compact:
+            json.dump(ordered, fp, separators=(",", ":"))
+        else:
+            json.dump(ordered, fp, indent=2)
     return written, skipped_existing, missing_series
 
 
@@ -116,12 +135,17 @@ def main() -> int:
     parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Number of days to seed (default: 365).")
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Output historical JSON path.")
     parser.add_argument("--force", action="store_true", help="Overwrite existing non-seeded entries.")
+    parser.add_argument(
+        "--compact", action="store_true", help="Write compact JSON (default: indent=2, matching process.py)."
+    )
     args = parser.parse_args()
 
     if args.days <= 0:
         raise SystemExit("--days must be greater than 0")
 
-    written, skipped_existing, missing_series = seed_history(days=args.days, output=args.output, force=args.force)
+    written, skipped_existing, missing_series = seed_history(
+        days=args.days, output=args.output, force=args.force, compact=args.compact
+    )
     print(
         f"Seed complete: wrote={written}, skipped_non_seeded={skipped_existing}, missing_series_days={missing_series}, output={args.output}"
     )
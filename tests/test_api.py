@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import tempfile
 import unittest
+from contextlib import closing
 from pathlib import Path
+from unittest.mock import patch
 
 try:
     from fastapi.testclient import TestClient
@@ -18,12 +21,27 @@ except ImportError:
 
 @unittest.skipUnless(FASTAPI_AVAILABLE, "fastapi is not installed")
 class ApiContractTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.published_latest = self.data_dir / "published_latest.json"
-        self.historical = self.data_dir / "historical.json"
-        self.releases_db = self.data_dir / "releases.db"
+    @classmethod
+    def setUpClass(cls) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.data_dir = Path(tmp.name)
+        cls.published_latest = cls.data_dir / "published_latest.json"
+        cls.historical = cls.data_dir / "historical.json"
+        cls.releases_db = cls.data_dir / "releases.db"
+
+        patcher = patch.multiple(
+            "api.main",
+            LATEST_PATH=cls.data_dir / "latest.json",
+            PUBLISHED_LATEST_PATH=cls.published_latest,
+            HISTORICAL_PATH=cls.historical,
+            RELEASE_DB_PATH=cls.releases_db,
+            PERFORMANCE_SUMMARY_PATH=cls.data_dir / "performance_summary.json",
+            RELEASE_EVENTS_PATH=cls.data_dir / "release_events.json",
+            CONSENSUS_LATEST_PATH=cls.data_dir / "consensus_latest.json",
+        )
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
 
         snapshot = {
             "as_of_date": "2026-02-15",
@@ -95,8 +113,8 @@ class ApiContractTests(unittest.TestCase):
                 "published_at": "2026-02-15T00:00:00+00:00",
             },
         }
-        self.published_latest.write_text(json.dumps(snapshot))
-        self.historical.write_text(
+        cls.published_latest.write_text(json.dumps(snapshot))
+        cls.historical.write_text(
             json.dumps(
                 {
                     "2026-02-15": {
@@ -108,7 +126,7 @@ class ApiContractTests(unittest.TestCase):
                 }
             )
         )
-        (self.data_dir / "performance_summary.json").write_text(
+        (cls.data_dir / "performance_summary.json").write_text(
             json.dumps(
                 {
                     "method_version": "v1.5.0",
@@ -125,7 +143,7 @@ class ApiContractTests(unittest.TestCase):
                 }
             )
         )
-        (self.data_dir / "release_events.json").write_text(
+        (cls.data_dir / "release_events.json").write_text(
             json.dumps(
                 {
                     "events": [
@@ -148,7 +166,7 @@ class ApiContractTests(unittest.TestCase):
                 }
             )
         )
-        (self.data_dir / "consensus_latest.json").write_text(
+        (cls.data_dir / "consensus_latest.json").write_text(
             json.dumps(
                 {
                     "as_of": "2026-02-16T12:00:00+00:00",
@@ -160,17 +178,23 @@ class ApiContractTests(unittest.TestCase):
             )
         )
 
-        with sqlite3.connect(self.releases_db) as conn:
+        release_runs = [
+            ("run_123", "2026-02-15T00:00:00+00:00", "published", "[]", "data/runs/run_123.json"),
+        ]
+        with closing(sqlite3.connect(cls.releases_db)) as conn:
+            # Throwaway fixture DB: skip journaling and fsync.
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            conn.execute("PRAGMA synchronous=OFF")
             conn.execute(
                 "CREATE TABLE IF NOT EXISTS release_runs (run_id TEXT PRIMARY KEY, created_at TEXT NOT NULL, status TEXT NOT NULL, blocked_conditions TEXT NOT NULL, snapshot_path TEXT NOT NULL)"
             )
-            conn.execute(
+            conn.executemany(
                 "INSERT OR REPLACE INTO release_runs (run_id, created_at, status, blocked_conditions, snapshot_path) VALUES (?, ?, ?, ?, ?)",
-                ("run_123", "2026-02-15T00:00:00+00:00", "published", "[]", "data/runs/run_123.json"),
+                release_runs,
             )
             conn.commit()
 
-        self.client = TestClient(app)
+        cls.client = TestClient(app)
 
     def test_latest_endpoint(self) -> None:
         resp = self.client.get("/v1/nowcast/latest")
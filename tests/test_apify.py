@@ -1,9 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import time
 import unittest
 from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from scrapers.grocery_apify import normalize_apify_item
+from scrapers.grocery_apify import _race_actors, normalize_apify_item
+
+
+class _FakeApifyClient:
+    """Minimal async stand-in for ApifyClientAsync keyed by actor id."""
+
+    def __init__(self, delays: dict[str, float], items: dict[str, list[dict]]) -> None:
+        self.delays = delays
+        self.items = items
+        self.aborted: list[str] = []
+        self.polled: list[str] = []
+
+    def actor(self, actor_id: str):
+        async def start(run_input, wait_for_finish=None):
+            status = "SUCCEEDED" if self.delays[actor_id] == 0 else "RUNNING"
+            return {"id": f"run-{actor_id}", "status": status, "defaultDatasetId": f"ds-{actor_id}"}
+
+        return SimpleNamespace(start=start)
+
+    def run(self, run_id: str):
+        actor_id = run_id.removeprefix("run-")
+
+        async def wait_for_finish():
+            self.polled.append(actor_id)
+            await asyncio.sleep(self.delays[actor_id])
+            return {"id": run_id, "defaultDatasetId": f"ds-{actor_id}"}
+
+        async def abort():
+            self.aborted.append(actor_id)
+
+        return SimpleNamespace(wait_for_finish=wait_for_finish, abort=abort)
+
+    def dataset(self, dataset_id: str):
+        actor_id = dataset_id.removeprefix("ds-")
+
+        async def list_items(limit: int, clean: bool = False):
+            return SimpleNamespace(items=self.items.get(actor_id, []))
+
+        return SimpleNamespace(list_items=list_items)
 
 
 class ApifyNormalizationTests(unittest.TestCase):
@@ -28,5 +70,87 @@ class ApifyNormalizationTests(unittest.TestCase):
         self.assertIsNone(quote)
 
 
+class ApifyActorRaceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.multiple("scrapers.grocery_apify", HEDGE_DELAY_SECONDS=0.01, _last_hedge_at=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_actor_with_quotes_wins_and_others_are_aborted(self) -> None:
+        client = _FakeApifyClient(
+            delays={"slow": 5.0, "fast": 0.0},
+            items={"fast": [{"name": "Milk 2L", "price": 5.49, "packageSize": "2 L"}]},
+        )
+        run_inputs = [{"categoryUrl": "https://example.com/c/1"}]
+        winner, errors, run_id = asyncio.run(
+            _race_actors(client, ["slow", "fast"], run_inputs, max_items=10, observed=date(2026, 2, 15))
+        )
+
+        assert winner is not None
+        self.assertEqual("fast", winner.actor_id)
+        self.assertEqual("run-fast", run_id)
+        self.assertEqual(1, len(winner.quotes))
+        self.assertEqual(["slow"], client.aborted)
+        self.assertEqual(["slow"], client.polled)
+        self.assertEqual([], errors)
+
+    def test_all_actors_empty_reports_errors(self) -> None:
+        client = _FakeApifyClient(delays={"a": 0.0, "b": 0.0}, items={})
+        run_inputs = [{"categoryUrl": "https://example.com/c/1"}]
+        winner, errors, _ = asyncio.run(
+            _race_actors(client, ["a", "b"], run_inputs, max_items=10, observed=date(2026, 2, 15))
+        )
+
+        self.assertIsNone(winner)
+        self.assertEqual(2, len(errors))
+
+    def test_hedge_budget_falls_back_to_sequential_runs(self) -> None:
+        client = _FakeApifyClient(
+            delays={"slow": 0.05, "fast": 0.0},
+            items={"fast": [{"name": "Milk 2L", "price": 5.49, "packageSize": "2 L"}]},
+        )
+        run_inputs = [{"categoryUrl": "https://example.com/c/1"}]
+        with patch("scrapers.grocery_apify._take_hedge_token", return_value=False):
+            winner, errors, _ = asyncio.run(
+                _race_actors(client, ["slow", "fast"], run_inputs, max_items=10, observed=date(2026, 2, 15))
+            )
+
+        assert winner is not None
+        self.assertEqual("fast", winner.actor_id)
+        self.assertEqual([], client.aborted)
+        self.assertEqual(1, len(errors))
+
+    def test_open_circuit_skips_actor_and_success_clears_it(self) -> None:
+        client = _FakeApifyClient(
+            delays={"dead": 0.0, "live": 0.0},
+            items={"live": [{"name": "Milk 2L", "price": 5.49, "packageSize": "2 L"}]},
+        )
+        run_inputs = [{"categoryUrl": "https://example.com/c/1"}]
+        breaker = {
+            "dead": {"failures": 3, "opened_at": time.time()},
+            "live": {"failures": 1, "opened_at": time.time()},
+        }
+        winner, errors, _ = asyncio.run(
+            _race_actors(client, ["dead", "live"], run_inputs, max_items=10, observed=date(2026, 2, 15), breaker=breaker)
+        )
+
+        assert winner is not None
+        self.assertEqual("live", winner.actor_id)
+        self.assertEqual(["dead: circuit open"], errors)
+        self.assertEqual(["dead"], list(breaker))
+
+    def test_failures_open_circuit_but_all_open_still_runs(self) -> None:
+        client = _FakeApifyClient(delays={"a": 0.0}, items={})
+        run_inputs = [{"categoryUrl": "https://example.com/c/1"}]
+        breaker = {"a": {"failures": 3, "opened_at": time.time()}}
+        winner, errors, _ = asyncio.run(
+            _race_actors(client, ["a"], run_inputs, max_items=10, observed=date(2026, 2, 15), breaker=breaker)
+        )
+
+        self.assertIsNone(winner)
+        self.assertEqual(1, len(errors))
+        self.assertEqual(4, breaker["a"]["failures"])
+
+
 if __name__ == "__main__":
     unittest.main()
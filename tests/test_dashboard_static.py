@@ -5,13 +5,17 @@ from pathlib import Path
 
 
 class DashboardStaticTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.html = Path("index.html").read_text(encoding="utf-8")
+
     def test_drivers_placeholder_copy_present(self) -> None:
-        html = Path("index.html").read_text()
+        html = self.html
         self.assertIn('id="category-placeholder"', html)
         self.assertIn("Insufficient day-over-day history for category contribution ranking.", html)
 
     def test_yoy_terminology_present(self) -> None:
-        html = Path("index.html").read_text()
+        html = self.html
         self.assertIn("Nowcast vs Official CPI (Year-over-Year)", html)
         self.assertIn("Deviation from Expectations", html)
         self.assertIn("Calculation ID", html)
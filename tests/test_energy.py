@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from scrapers.energy import _latest_energy_from_zip, _scrape_statcan_energy
+
+
+def _row(ref_date: str, product: str, value: str) -> dict[str, str]:
+    return {"REF_DATE": ref_date, "Products and product groups": product, "VALUE": value}
+
+
+class StatcanEnergyTests(unittest.TestCase):
+    def test_wds_vector_is_primary_path(self) -> None:
+        with patch("scrapers.energy.latest_vector", return_value=("2026-01", 187.4)), patch(
+            "scrapers.energy._latest_energy_from_zip"
+        ) as zip_fallback:
+            quotes, health = _scrape_statcan_energy()
+
+        zip_fallback.assert_not_called()
+        self.assertEqual(1, len(quotes))
+        self.assertEqual(187.4, quotes[0].value)
+        self.assertEqual("2026-01", health[0].last_observation_period)
+        self.assertIn("WDS vector", health[0].detail)
+
+    def test_zip_fallback_used_when_wds_fails(self) -> None:
+        with patch("scrapers.energy.latest_vector", side_effect=RuntimeError("503")), patch(
+            "scrapers.energy._latest_energy_from_zip", return_value=("2025-12", 185.0)
+        ):
+            quotes, health = _scrape_statcan_energy()
+
+        self.assertEqual(185.0, quotes[0].value)
+        self.assertEqual("stale", health[0].status)
+        self.assertIn("CSV ZIP", health[0].detail)
+
+    def test_zip_fallback_picks_latest_canada_energy_row(self) -> None:
+        rows = [
+            _row("2025-11", "Energy", "183.1"),
+            _row("2025-12", "All-items", "161.0"),
+            _row("2025-12", "Energy", "184.2"),
+        ]
+        with patch("scrapers.statcan_cache.get_canada_cpi_rows", return_value=rows):
+            latest_ref, latest_val = _latest_energy_from_zip()
+
+        self.assertEqual("2025-12", latest_ref)
+        self.assertEqual(184.2, latest_val)
+
+
+if __name__ == "__main__":
+    unittest.main()
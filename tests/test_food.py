@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from scrapers.food import OPEN_FOOD_FACTS_PAGES, scrape_food
+
+
+def _page_number(url: str) -> int:
+    return int(url.rsplit("page=", 1)[1])
+
+
+class OpenFoodFactsTests(unittest.TestCase):
+    def test_partial_page_failures_keep_items_and_are_reported(self) -> None:
+        def fake_fetch(url: str):
+            page = _page_number(url)
+            if page == 1:
+                return {"items": [{"price": "3.49", "product_name": "Milk", "date": "2026-02-01"}]}
+            raise RuntimeError(f"page {page} timed out")
+
+        with patch("scrapers.food.fetch_json", side_effect=fake_fetch):
+            quotes, health = scrape_food()
+
+        self.assertEqual([3.49], [q.value for q in quotes])
+        self.assertEqual("fresh", health[0].status)
+        self.assertIn(f"{OPEN_FOOD_FACTS_PAGES - 1} of {OPEN_FOOD_FACTS_PAGES} pages failed", health[0].detail)
+
+    def test_all_pages_failing_marks_source_missing(self) -> None:
+        with patch("scrapers.food.fetch_json", side_effect=RuntimeError("503")):
+            quotes, health = scrape_food()
+
+        self.assertEqual([], quotes)
+        self.assertEqual("missing", health[0].status)
+        self.assertIn("Fetch failed: 503", health[0].detail)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -43,6 +44,28 @@ class HealthPublicTests(unittest.TestCase):
         self.assertEqual("missing", pmprb_health.status)
         self.assertIn("All PMPRB URLs failed", pmprb_health.detail)
 
+    def test_pmprb_slow_primary_still_wins_over_later_url(self) -> None:
+        secondary_done = threading.Event()
+
+        def fake_fetch(url: str, timeout: int = 20, retries: int = 1):
+            if "dpd-bdpp" in url:
+                return "price 22"
+            if url == PMPRB_REPORTS_URLS[0]:
+                # Answer only after the second URL has already returned.
+                secondary_done.wait(5)
+                return "index 99"
+            if url == PMPRB_REPORTS_URLS[1]:
+                secondary_done.set()
+                return "index 11 12"
+            raise RuntimeError("down")
+
+        with patch("scrapers.health_public.fetch_url", side_effect=fake_fetch):
+            quotes, health = scrape_health_public()
+
+        pmprb_health = next(item for item in health if item.source == "pmprb_reports")
+        self.assertIn(PMPRB_REPORTS_URLS[0], pmprb_health.detail)
+        pmprb_values = [q.value for q in quotes if q.source == "pmprb_reports"]
+        self.assertEqual([99.0], pmprb_values)
 
 if __name__ == "__main__":
     unittest.main()
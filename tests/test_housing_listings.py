@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from scrapers.housing_listings import scrape_housing_listings
+
+
+class HousingListingsTests(unittest.TestCase):
+    def test_headline_paragraph_price_wins_over_earlier_prices(self) -> None:
+        html = (
+            "<p>Sponsored: luxury suites from $3,900</p>"
+            '<p class="lead">In Canada, the average asking rent was $2,178, while Toronto hit $2,900.</p>'
+        )
+        with patch("scrapers.housing_listings.fetch_url", return_value=html):
+            quotes, health = scrape_housing_listings()
+
+        self.assertEqual([2178.0], [quote.value for quote in quotes])
+        self.assertEqual("fresh", health[0].status)
+
+    def test_unclosed_paragraph_does_not_borrow_later_prices(self) -> None:
+        html = (
+            "<p>In Canada, the average asking rent rose.<p>Toronto rent hit $2,900</p>"
+            "<p>Canada's average asking rent reached $2,150.</p>"
+        )
+        with patch("scrapers.housing_listings.fetch_url", return_value=html):
+            quotes, _ = scrape_housing_listings()
+
+        self.assertEqual([2150.0], [quote.value for quote in quotes])
+
+    def test_falls_back_to_first_reasonable_price(self) -> None:
+        html = "<div>Rent report: $900 parking, $2,050 national</div>"
+        with patch("scrapers.housing_listings.fetch_url", return_value=html):
+            quotes, _ = scrape_housing_listings()
+
+        self.assertEqual([2050.0], [quote.value for quote in quotes])
+
+
+if __name__ == "__main__":
+    unittest.main()
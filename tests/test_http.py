@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from scrapers import http
+from scrapers.common import FetchError
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None, content: bytes = b"") -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = content
+    return response
+
+
+class SharedHttpTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        patcher = patch.object(http, "get_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep_patcher = patch.object(http.time, "sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+        budget_patcher = patch.object(http, "RETRY_BUDGET", http.RetryBudget(capacity=10, refill_per_second=0))
+        budget_patcher.start()
+        self.addCleanup(budget_patcher.stop)
+
+    def test_retries_503_and_honours_retry_after(self) -> None:
+        self.client.request.side_effect = [_response(503, {"Retry-After": "7"}), _response(200, content=b"ok")]
+        self.assertEqual(b"ok", http.get_bytes("https://example.com/a.zip"))
+        self.assertEqual(2, self.client.request.call_count)
+        self.sleep.assert_called_once_with(7.0)
+
+    def test_does_not_retry_plain_4xx(self) -> None:
+        self.client.request.return_value = _response(404)
+        with self.assertRaises(FetchError):
+            http.get_bytes("https://example.com/missing.zip")
+        self.assertEqual(1, self.client.request.call_count)
+        self.sleep.assert_not_called()
+
+    def test_retry_budget_stops_retry_amplification(self) -> None:
+        self.client.request.return_value = _response(500)
+        with patch.object(http, "RETRY_BUDGET", http.RetryBudget(capacity=1, refill_per_second=0)):
+            with self.assertRaises(FetchError):
+                http.request("GET", "https://example.com", retries=5)
+        self.assertEqual(2, self.client.request.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
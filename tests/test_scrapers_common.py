@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
 import ssl
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
-from scrapers.common import FetchError, fetch_url
+from scrapers.common import FetchError, fetch_url, load_env_file
 
 
 class _FakeResponse:
@@ -47,6 +50,16 @@ class ScrapersCommonTests(unittest.TestCase):
                 allowed_insecure_hosts={"crtc.gc.ca"},
             )
 
+    def test_load_env_file_keeps_existing_environment_values(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            env_path = Path(tmp) / ".env"
+            env_path.write_text('# local secrets\nAPIFY_TOKEN="from-file"\nAPIFY_BANNER=nofrills\n')
+            with patch.dict(os.environ, {"APIFY_BANNER": "superstore"}, clear=False):
+                os.environ.pop("APIFY_TOKEN", None)
+                load_env_file.__wrapped__(str(env_path))
+                self.assertEqual("from-file", os.environ["APIFY_TOKEN"])
+                self.assertEqual("superstore", os.environ["APIFY_BANNER"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,66 +1,123 @@
 from __future__ import annotations
 
 import json
-import runpy
 import tempfile
 import unittest
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator
+from unittest.mock import patch
 
+from scripts.seed_history import seed_history
 
-SCRIPT_PATH = Path("scripts/seed_history.py")
+
+# Read-only rows: the payloads are shared by every test, so seed_history must not mutate them.
+_CPI_PAYLOAD_FULL = (
+    MappingProxyType({"ref_date": "2025-12", "index_value": 160.0, "mom_pct": -0.1, "yoy_pct": 2.0}),
+    MappingProxyType({"ref_date": "2026-01", "index_value": 161.0, "mom_pct": 0.2, "yoy_pct": 2.2}),
+    MappingProxyType({"ref_date": "2026-02", "index_value": 162.0, "mom_pct": 0.3, "yoy_pct": 2.4}),
+)
+_CPI_PAYLOAD_FEB = _CPI_PAYLOAD_FULL[-1:]
+
+
+@lru_cache(maxsize=1)
+def _fake_fetch_full() -> list[MappingProxyType]:
+    return list(_CPI_PAYLOAD_FULL)
+
+
+@lru_cache(maxsize=1)
+def _fake_fetch_feb() -> list[MappingProxyType]:
+    return list(_CPI_PAYLOAD_FEB)
+
+
+def _fake_fetch_feb_iter() -> Iterator[MappingProxyType]:
+    return iter(_CPI_PAYLOAD_FEB)
+
+
+class _FrozenDate(date):
+    @classmethod
+    def today(cls) -> date:
+        return cls(2026, 3, 15)
 
 
 class SeedHistoryTests(unittest.TestCase):
-    def _load_module(self) -> dict:
-        return runpy.run_path(str(SCRIPT_PATH))
+    # A live (non-seeded) row for the frozen "today".
+    _EXISTING_BYTES = b'{"2026-03-15": {"headline": {"nowcast_mom_pct": 0.9}, "meta": {"seeded": false}}}'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        patcher = patch("scripts.seed_history.date", _FrozenDate)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls._tmp_dir = Path(tmp.name)
+
+    def _use_series(self, fake) -> None:
+        patcher = patch.dict(seed_history.__globals__, {"fetch_official_cpi_series": fake})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _output_path(self) -> Path:
+        return self._tmp_dir / f"{self._testMethodName}.json"
 
     def test_seed_history_writes_rows_with_provenance(self) -> None:
-        module = self._load_module()
-        seed_history = module["seed_history"]
-        seed_history.__globals__["fetch_official_cpi_series"] = lambda: [
-            {"ref_date": "2025-12", "index_value": 160.0, "mom_pct": -0.1, "yoy_pct": 2.0},
-            {"ref_date": "2026-01", "index_value": 161.0, "mom_pct": 0.2, "yoy_pct": 2.2},
-            {"ref_date": "2026-02", "index_value": 162.0, "mom_pct": 0.3, "yoy_pct": 2.4},
-        ]
-
-        with tempfile.TemporaryDirectory() as tmp:
-            out = Path(tmp) / "historical.json"
+        self._use_series(_fake_fetch_full)
+
+        out = self._output_path()
+        with patch.object(json, "dump", wraps=json.dump) as dump:
             written, skipped, missing = seed_history(days=365, output=out, force=False)
-            self.assertGreaterEqual(written, 300)
-            self.assertEqual(0, skipped)
-            self.assertEqual(0, missing)
-
-            payload = json.loads(out.read_text())
-            sample = payload[sorted(payload.keys())[-1]]
-            self.assertTrue(sample["meta"]["seeded"])
-            self.assertEqual("official_monthly_baseline", sample["meta"]["seed_type"])
-            self.assertEqual("statcan_cpi_csv", sample["meta"]["seed_source"])
-            self.assertIn("official_cpi", sample)
-            self.assertNotIn("headline", sample)
+        # Fresh output and a frozen clock: every day in the window is seeded.
+        self.assertEqual(365, written)
+        self.assertEqual(0, skipped)
+        self.assertEqual(0, missing)
+        self.assertEqual(1, dump.call_count)
+
+        with out.open("rb") as fp:
+            payload = json.load(fp)
+        self.assertEqual("2026-03-15", max(payload))
+        sample = payload[max(payload)]
+        self.assertTrue(sample["meta"]["seeded"])
+        self.assertEqual("official_monthly_baseline", sample["meta"]["seed_type"])
+        self.assertEqual("statcan_cpi_csv", sample["meta"]["seed_source"])
+        self.assertIn("official_cpi", sample)
+        self.assertNotIn("headline", sample)
 
     def test_seed_history_skips_non_seeded_rows_without_force(self) -> None:
-        module = self._load_module()
-        seed_history = module["seed_history"]
-        seed_history.__globals__["fetch_official_cpi_series"] = lambda: [
-            {"ref_date": "2026-02", "index_value": 162.0, "mom_pct": 0.3, "yoy_pct": 2.4},
-        ]
-
-        with tempfile.TemporaryDirectory() as tmp:
-            out = Path(tmp) / "historical.json"
-            today = date.today().isoformat()
-            existing = {
-                today: {
-                    "headline": {"nowcast_mom_pct": 0.9},
-                    "meta": {"seeded": False},
-                }
-            }
-            out.write_text(json.dumps(existing))
-            written, skipped, _ = seed_history(days=1, output=out, force=False)
-            self.assertEqual(0, written)
-            self.assertEqual(1, skipped)
-            payload = json.loads(out.read_text())
-            self.assertEqual(0.9, payload[today]["headline"]["nowcast_mom_pct"])
+        self._use_series(_fake_fetch_feb_iter)
+
+        out = self._output_path()
+        out.write_bytes(self._EXISTING_BYTES)
+        written, skipped, _ = seed_history(days=1, output=out, force=False)
+        self.assertEqual(0, written)
+        self.assertEqual(1, skipped)
+        payload = json.loads(out.read_bytes())
+        self.assertEqual(0.9, payload["2026-03-15"]["headline"]["nowcast_mom_pct"])
+
+    def test_seed_history_rerun_leaves_unchanged_file_alone(self) -> None:
+        self._use_series(_fake_fetch_feb)
+
+        out = self._output_path()
+        first, _, _ = seed_history(days=30, output=out, force=False)
+        with out.open("ab") as fp:
+            fp.write(b"\n")
+        second, skipped, _ = seed_history(days=30, output=out, force=False)
+        self.assertEqual(30, first)
+        self.assertEqual(0, second)
+        self.assertEqual(0, skipped)
+        self.assertTrue(out.read_bytes().endswith(b"\n"))
+
+    def test_seed_history_recovers_after_empty_fetch(self) -> None:
+        out = self._output_path()
+        self._use_series(lambda: [])
+        with self.assertRaises(RuntimeError):
+            seed_history(days=1, output=out, force=False)
+
+        self._use_series(_fake_fetch_feb)
+        written, _, _ = seed_history(days=1, output=out, force=False)
+        self.assertEqual(1, written)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import json
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from scrapers import statcan_cache
+
+
+def _zip_bytes(csv_text: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("18100004.csv", csv_text.encode("utf-8-sig"))
+    return buffer.getvalue()
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class StatcanCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        patcher = patch.multiple(
+            statcan_cache,
+            CACHE_DIR=self.cache_dir,
+            CACHE_ZIP_PATH=self.cache_dir / "statcan_cpi.zip",
+            CACHE_META_PATH=self.cache_dir / "statcan_cpi.meta.json",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        statcan_cache.fetch_cpi_zip.cache_clear()
+        statcan_cache.get_canada_cpi_rows.cache_clear()
+        self.addCleanup(statcan_cache.fetch_cpi_zip.cache_clear)
+        self.addCleanup(statcan_cache.get_canada_cpi_rows.cache_clear)
+
+    def test_download_is_memoized_and_persisted(self) -> None:
+        body = _zip_bytes(
+            '"REF_DATE","GEO","DGUID","Products and product groups","UOM","VALUE"\n'
+            '"2025-12","Ontario","2016A000235","All-items","2002=100","163.0"\n'
+            '"2025-12","Canada","2016A000011124","All-items","2002=100","161.0"\n'
+        )
+        response = _FakeResponse(200, body, {"ETag": '"abc"', "Last-Modified": "Tue, 20 Jan 2026 13:30:00 GMT"})
+        with patch.object(statcan_cache, "request", return_value=response) as fake_request:
+            rows = statcan_cache.get_canada_cpi_rows()
+            again = statcan_cache.fetch_cpi_zip()
+
+        self.assertEqual(1, fake_request.call_count)
+        self.assertEqual(body, again)
+        self.assertEqual(
+            [{"REF_DATE": "2025-12", "GEO": "Canada", "Products and product groups": "All-items", "VALUE": "161.0"}],
+            rows,
+        )
+        self.assertEqual(body, (self.cache_dir / "statcan_cpi.zip").read_bytes())
+        meta = json.loads((self.cache_dir / "statcan_cpi.meta.json").read_text())
+        self.assertEqual('"abc"', meta["etag"])
+
+    def test_not_modified_reuses_disk_copy(self) -> None:
+        body = _zip_bytes('"REF_DATE","GEO","Products and product groups","VALUE"\n')
+        (self.cache_dir / "statcan_cpi.zip").write_bytes(body)
+        (self.cache_dir / "statcan_cpi.meta.json").write_text(json.dumps({"etag": '"abc"', "last_modified": ""}))
+
+        with patch.object(statcan_cache, "request", return_value=_FakeResponse(304)) as fake_request:
+            data = statcan_cache.fetch_cpi_zip()
+
+        self.assertEqual(body, data)
+        self.assertEqual({"If-None-Match": '"abc"'}, fake_request.call_args.kwargs["headers"])
+
+    def test_non_zip_payload_yields_no_rows(self) -> None:
+        with patch.object(statcan_cache, "fetch_cpi_zip", return_value=b"<html>maintenance</html>"):
+            self.assertEqual([], statcan_cache.get_canada_cpi_rows())
+
+    def test_latest_canada_values_keeps_newest_matching_product(self) -> None:
+        rows = [
+            {"REF_DATE": "2025-11", "GEO": "Canada", "Products and product groups": "Shelter", "VALUE": "170.1"},
+            {"REF_DATE": "2025-12", "GEO": "Canada", "Products and product groups": "Shelter", "VALUE": "171.4"},
+            {"REF_DATE": "2025-12", "GEO": "Canada", "Products and product groups": "Energy", "VALUE": "184.2"},
+            {"REF_DATE": "2026-01", "GEO": "Canada", "Products and product groups": "Shelter", "VALUE": ""},
+        ]
+        with patch.object(statcan_cache, "get_canada_cpi_rows", return_value=rows):
+            latest = statcan_cache.latest_canada_values({"Shelter"}.__contains__)
+
+        self.assertEqual({"Shelter": ("2025-12", 171.4)}, latest)
+
+
+if __name__ == "__main__":
+    unittest.main()